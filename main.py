@@ -1,17 +1,21 @@
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, HttpUrl
-from sqlalchemy import create_engine, Column, String, DateTime, Integer
+from sqlalchemy import Column, String, DateTime, Integer, select, update, event
+from cachetools import LRUCache, TTLCache
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timezone
 import hashlib
+import time
 import string
-import random
 import os
-import json
+import orjson
+import msgpack
 import asyncio
+from collections import defaultdict
 from typing import Dict, List
 import logging
 
@@ -19,7 +23,27 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="URL Shortener Service", version="1.0.0")
+# orjson renders response bodies 2-5x faster than the stdlib encoder
+app = FastAPI(title="URL Shortener Service", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Bind the tz singleton once; datetime.now(timezone.utc) pays two
+# attribute lookups on every call
+_UTC = timezone.utc
+
+# Hot paths stamp many events per second; share one formatted "now"
+# string per 50 ms window instead of formatting per event
+_ISO_NOW_RESOLUTION = 0.05  # seconds
+_iso_now_cache = (0.0, "")
+
+def _iso_now() -> str:
+    """Current UTC time in ISO format, coarsened to 50 ms"""
+    global _iso_now_cache
+    now = time.monotonic()
+    cached_at, value = _iso_now_cache
+    if not value or now - cached_at >= _ISO_NOW_RESOLUTION:
+        value = datetime.now(_UTC).isoformat()
+        _iso_now_cache = (now, value)
+    return value
 
 # Add CORS middleware
 app.add_middleware(
@@ -31,58 +55,298 @@ app.add_middleware(
 )
 
 # Database configuration
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./urls.db")
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _async_database_url(url: str) -> str:
+    """Rewrite a sync database URL to its async driver equivalent"""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql:"):
+        return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    return url
+
+DATABASE_URL = _async_database_url(os.getenv("DATABASE_URL", "sqlite:///./urls.db"))
+
+# Pool sizing is tunable per deployment; the defaults (pool_size=5,
+# max_overflow=10) stall under bursts of ~100 concurrent requests
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers run concurrently with the writer and, with
+    # synchronous=NORMAL, stops fsyncing on every COMMIT (the default
+    # rollback journal + FULL sync serializes the whole write path)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+def _create_engine(url: str):
+    if url.startswith("sqlite"):
+        # SQLite serializes writers on a single file anyway; pool sizing
+        # does not apply, but pooled connections must be usable across
+        # threads
+        eng = create_async_engine(url, connect_args={"check_same_thread": False})
+        event.listen(eng.sync_engine, "connect", _set_sqlite_pragmas)
+        return eng
+    return create_async_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+
+engine = _create_engine(DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+
+# Read-only traffic (analytics, WebSocket snapshots) can be routed to a
+# replica so dashboard polling never contends with the write pool
+READER_DATABASE_URL = _async_database_url(os.getenv("READER_DATABASE_URL", ""))
+if READER_DATABASE_URL and READER_DATABASE_URL != DATABASE_URL:
+    reader_engine = _create_engine(READER_DATABASE_URL)
+    ReaderSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=reader_engine)
+else:
+    # No replica configured: reads fall back to the primary
+    reader_engine = engine
+    ReaderSessionLocal = AsyncSessionLocal
+
 Base = declarative_base()
 
 # WebSocket connection manager
+SEND_QUEUE_SIZE = 64
+HEARTBEAT_INTERVAL = 30  # seconds
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # short_code -> {websocket: send queue}; every socket has its own
+        # bounded queue and writer task, so a slow client backpressures
+        # only itself instead of the whole broadcast. Dict buckets keep
+        # add/remove O(1) regardless of subscriber count.
+        self.active_connections: Dict[str, Dict[WebSocket, asyncio.Queue]] = defaultdict(dict)
+        self._writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+
+    @staticmethod
+    def uses_msgpack(websocket: WebSocket) -> bool:
+        """Whether the client negotiated the msgpack subprotocol"""
+        return "msgpack" in websocket.scope.get("subprotocols", [])
+
+    @staticmethod
+    def serialize_frame(websocket: WebSocket, data: dict):
+        """Encode a payload as msgpack or JSON per the negotiated subprotocol"""
+        if ConnectionManager.uses_msgpack(websocket):
+            return msgpack.packb(data, use_bin_type=True)
+        return orjson.dumps(data).decode()
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue, short_code: str):
+        """Drain one client's queue; frames are already serialized"""
+        try:
+            while True:
+                frame = await queue.get()
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"WebSocket send error: {e}")
+            self.disconnect(websocket, short_code)
 
     async def connect(self, websocket: WebSocket, short_code: str):
-        await websocket.accept()
-        if short_code not in self.active_connections:
-            self.active_connections[short_code] = []
-        self.active_connections[short_code].append(websocket)
+        # MessagePack frames are 30-50% smaller and cheaper to encode than
+        # JSON; clients opt in via the subprotocol, JSON stays the default
+        if self.uses_msgpack(websocket):
+            await websocket.accept(subprotocol="msgpack")
+        else:
+            await websocket.accept()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.active_connections[short_code][websocket] = queue
+        self._writer_tasks[websocket] = asyncio.create_task(
+            self._writer(websocket, queue, short_code)
+        )
         logger.info(f"WebSocket connected for short_code: {short_code}")
 
     def disconnect(self, websocket: WebSocket, short_code: str):
-        if short_code in self.active_connections:
-            if websocket in self.active_connections[short_code]:
-                self.active_connections[short_code].remove(websocket)
-            if not self.active_connections[short_code]:
+        bucket = self.active_connections.get(short_code)
+        if bucket is not None:
+            bucket.pop(websocket, None)
+            if not bucket:
                 del self.active_connections[short_code]
+        task = self._writer_tasks.pop(websocket, None)
+        if task is not None:
+            task.cancel()
         logger.info(f"WebSocket disconnected for short_code: {short_code}")
 
-    async def send_analytics_update(self, short_code: str, analytics_data: dict):
-        if short_code in self.active_connections:
-            disconnected = []
-            for connection in self.active_connections[short_code]:
-                try:
-                    await connection.send_text(json.dumps(analytics_data))
-                except Exception as e:
-                    logger.error(f"WebSocket send error: {e}")
-                    disconnected.append(connection)
-            
-            # Clean up disconnected clients
-            for conn in disconnected:
-                self.disconnect(conn, short_code)
+    def enqueue(self, websocket: WebSocket, short_code: str, data: dict):
+        """Queue a payload for one client without blocking the caller"""
+        queue = self.active_connections.get(short_code, {}).get(websocket)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(self.serialize_frame(websocket, data))
+        except asyncio.QueueFull:
+            logger.warning(f"WebSocket send queue full, dropping client for {short_code}")
+            self.disconnect(websocket, short_code)
+
+    def _fanout(self, targets, data: dict):
+        # Serialize at most once per wire format, then fan out with
+        # non-blocking puts; clients that cannot keep up are dropped
+        text_frame = None
+        binary_frame = None
+        stale = []
+        for short_code, websocket, queue in targets:
+            if self.uses_msgpack(websocket):
+                if binary_frame is None:
+                    binary_frame = msgpack.packb(data, use_bin_type=True)
+                frame = binary_frame
+            else:
+                if text_frame is None:
+                    text_frame = orjson.dumps(data).decode()
+                frame = text_frame
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                stale.append((short_code, websocket))
+
+        for short_code, websocket in stale:
+            logger.warning(f"WebSocket send queue full, dropping client for {short_code}")
+            self.disconnect(websocket, short_code)
+
+    def send_analytics_update(self, short_code: str, analytics_data: dict):
+        bucket = self.active_connections.get(short_code)
+        if not bucket:
+            return
+        self._fanout(
+            [(short_code, websocket, queue) for websocket, queue in bucket.items()],
+            analytics_data,
+        )
+
+    async def heartbeat_loop(self):
+        """Serialize one heartbeat per tick and fan it out to everyone
+
+        Previously every connection formatted and encoded its own
+        heartbeat; this is O(1) serializations per tick instead of
+        O(connections).
+        """
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            targets = [
+                (short_code, websocket, queue)
+                for short_code, bucket in list(self.active_connections.items())
+                for websocket, queue in list(bucket.items())
+            ]
+            if targets:
+                self._fanout(targets, {
+                    "type": "heartbeat",
+                    "timestamp": _iso_now()
+                })
 
 manager = ConnectionManager()
 
+# Lookaside cache for the hottest path: short_code -> (original_url,
+# created_at ISO string). Mappings are immutable (there is no delete
+# endpoint), so entries never go stale; the LRU bound only caps memory.
+url_cache: LRUCache = LRUCache(maxsize=100_000)
+
+# Fully rendered /analytics responses, cached briefly to absorb
+# dashboard polling bursts; the count flush invalidates entries it
+# changes so staleness is bounded by the TTL
+analytics_cache: TTLCache = TTLCache(maxsize=10_000, ttl=1.0)
+
+# Redirect counts are coalesced in memory and flushed in one transaction
+# per window instead of paying a COMMIT (and fsync) per redirect
+pending_counts: defaultdict = defaultdict(int)
+pending_counts_lock = asyncio.Lock()
+COUNT_FLUSH_INTERVAL = 0.5  # seconds
+
+async def _flush_pending_counts():
+    """Apply all coalesced redirect-count deltas in a single transaction"""
+    async with pending_counts_lock:
+        batch = dict(pending_counts)
+    if not batch:
+        return
+
+    flushed = {}
+    async with AsyncSessionLocal() as db:
+        for code, delta in batch.items():
+            result = await db.execute(
+                update(URLMapping)
+                .where(URLMapping.short_code == code)
+                .values(redirect_count=URLMapping.redirect_count + delta)
+            )
+            if result.rowcount:
+                flushed[code] = delta
+        await db.commit()
+
+    # Deltas stay pending until they are durably in the database, so
+    # analytics reads (stored + pending) never miss in-flight redirects;
+    # rows this engine cannot see keep their delta for the next flush
+    async with pending_counts_lock:
+        for code, delta in flushed.items():
+            remaining = pending_counts[code] - delta
+            if remaining:
+                pending_counts[code] = remaining
+            else:
+                del pending_counts[code]
+
+    for code in flushed:
+        analytics_cache.pop(code, None)
+
+async def _count_flush_loop():
+    while True:
+        await asyncio.sleep(COUNT_FLUSH_INTERVAL)
+        try:
+            await _flush_pending_counts()
+        except Exception as e:
+            logger.error(f"Error flushing redirect counts: {e}")
+
 # Database Models
 class URLMapping(Base):
     __tablename__ = "url_mappings"
-    
-    short_code = Column(String(10), primary_key=True, index=True)
+
+    # The primary key is already a unique B-tree; index=True here would
+    # create a redundant secondary index and double the write cost
+    short_code = Column(String(10), primary_key=True)
     original_url = Column(String(2048), nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=lambda: datetime.now(_UTC))
     redirect_count = Column(Integer, default=0)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+@app.on_event("startup")
+async def create_tables():
+    """Create tables on startup (async engines cannot run DDL at import time)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+@app.on_event("startup")
+async def start_count_flush_task():
+    app.state.count_flush_task = asyncio.create_task(_count_flush_loop())
+
+@app.on_event("startup")
+async def start_heartbeat_task():
+    app.state.heartbeat_task = asyncio.create_task(manager.heartbeat_loop())
+
+@app.on_event("shutdown")
+async def stop_heartbeat_task():
+    task = getattr(app.state, "heartbeat_task", None)
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+@app.on_event("shutdown")
+async def stop_count_flush_task():
+    task = getattr(app.state, "count_flush_task", None)
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await _flush_pending_counts()
 
 # Pydantic models
 class URLShortenRequest(BaseModel):
@@ -100,17 +364,34 @@ class AnalyticsResponse(BaseModel):
     created_at: datetime
 
 # Utility functions
-def generate_short_code(length: int = 6) -> str:
-    """Generate a random short code"""
-    characters = string.ascii_letters + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+_ALPHABET = string.ascii_letters + string.digits
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Read once at import; a per-request os.getenv costs an environ dict
+# lookup on every shorten
+_BASE_URL = os.getenv("BASE_URL", "http://localhost:8000").rstrip("/") + "/"
+MAX_SHORTEN_ATTEMPTS = 10
+
+def _base62_encode(num: int) -> str:
+    """Encode a non-negative integer using the short-code alphabet"""
+    if num == 0:
+        return _ALPHABET[0]
+    base = len(_ALPHABET)
+    chars = []
+    while num:
+        num, rem = divmod(num, base)
+        chars.append(_ALPHABET[rem])
+    return ''.join(reversed(chars))
+
+def generate_short_code(url: str, salt: int = 0, length: int = 6) -> str:
+    """Derive a short code deterministically from the URL
+
+    The same URL always hashes to the same code, so duplicate shortens
+    dedupe for free; a counter salt resolves genuine collisions.
+    """
+    data = url if not salt else f"{url}#{salt}"
+    digest = hashlib.sha256(data.encode()).digest()
+    code = _base62_encode(int.from_bytes(digest[:6], "big"))
+    return code.rjust(length, _ALPHABET[0])[:length]
 
 # IMPORTANT: Static routes MUST come before dynamic routes!
 
@@ -132,110 +413,136 @@ async def root():
 async def health_check():
     """Health check endpoint"""
     return {
-        "status": "healthy", 
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "status": "healthy",
+        "timestamp": datetime.now(_UTC).isoformat()
     }
 
 @app.post("/shorten", response_model=URLShortenResponse)
 async def shorten_url(request: URLShortenRequest):
     """Create a shortened URL"""
-    db = SessionLocal()
     try:
-        # Generate unique short code
-        max_attempts = 10
-        attempts = 0
+        url = str(request.url)
+
+        # Insert first and let the UNIQUE constraint catch collisions
+        # instead of paying a SELECT round-trip per attempt; the common
+        # case is a single INSERT with no reads at all
+        url_mapping = None
         short_code: str = ""
-        
-        while attempts < max_attempts:
-            short_code = generate_short_code()
-            existing = db.query(URLMapping).filter(URLMapping.short_code == short_code).first()
-            if not existing:
-                break
-            attempts += 1
-        
-        if attempts >= max_attempts or not short_code:
+
+        async with AsyncSessionLocal() as db:
+            for salt in range(MAX_SHORTEN_ATTEMPTS):
+                short_code = generate_short_code(url, salt)
+                candidate = URLMapping(short_code=short_code, original_url=url)
+                db.add(candidate)
+                try:
+                    await db.commit()
+                    url_mapping = candidate
+                    break
+                except IntegrityError:
+                    await db.rollback()
+                    existing = (await db.execute(
+                        select(URLMapping).where(URLMapping.short_code == short_code)
+                    )).scalar_one_or_none()
+                    if existing is not None and existing.original_url == url:
+                        # Same URL was already shortened: return the mapping
+                        url_mapping = existing
+                        break
+                    # A different URL collided on this code; rehash with salt
+
+        if url_mapping is None:
             raise HTTPException(status_code=500, detail="Unable to generate unique short code")
-        
-        # Create new URL mapping
-        url_mapping = URLMapping(
-            short_code=short_code,
-            original_url=str(request.url)
-        )
-        db.add(url_mapping)
-        db.commit()
-        
-        base_url = os.getenv("BASE_URL", "http://localhost:8000")
-        shortened_url = f"{base_url}/{short_code}"
-        
+
+        url_cache[short_code] = (url, url_mapping.created_at.isoformat())  # type: ignore
+
+        shortened_url = _BASE_URL + short_code
+
         logger.info(f"Created short URL: {short_code} -> {request.url}")
-        
+
         return URLShortenResponse(
             short_code=short_code,
             shortened_url=shortened_url,
-            original_url=str(request.url)
+            original_url=url
         )
-    
+
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error creating short URL: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        db.close()
 
 @app.get("/analytics/{short_code}", response_model=AnalyticsResponse)
 async def get_analytics(short_code: str):
     """Get analytics for a short URL"""
-    db = SessionLocal()
     try:
-        url_mapping = db.query(URLMapping).filter(URLMapping.short_code == short_code).first()
-        
+        cached = analytics_cache.get(short_code)
+        if cached is not None:
+            return cached
+
+        async with ReaderSessionLocal() as db:
+            url_mapping = (await db.execute(
+                select(URLMapping).where(URLMapping.short_code == short_code)
+            )).scalar_one_or_none()
+
         if not url_mapping:
             raise HTTPException(status_code=404, detail="Short URL not found")
-        
-        return AnalyticsResponse(
+
+        response = AnalyticsResponse(
             short_code=url_mapping.short_code,  # type: ignore
             original_url=url_mapping.original_url,  # type: ignore
-            redirect_count=url_mapping.redirect_count,  # type: ignore
+            # Include deltas that have not been flushed to the database yet
+            redirect_count=url_mapping.redirect_count + pending_counts.get(short_code, 0),  # type: ignore
             created_at=url_mapping.created_at  # type: ignore
         )
-    
+        analytics_cache[short_code] = response
+        return response
+
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error fetching analytics: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        db.close()
 
 @app.websocket("/ws/analytics/{short_code}")
 async def websocket_analytics(websocket: WebSocket, short_code: str):
     """WebSocket endpoint for real-time analytics updates"""
     await manager.connect(websocket, short_code)
     try:
-        # Send initial analytics data
-        db = SessionLocal()
-        try:
-            url_mapping = db.query(URLMapping).filter(URLMapping.short_code == short_code).first()
-            if url_mapping:
+        # Send initial analytics data; the immutable fields come from the
+        # lookup cache so repeat subscribers skip ORM hydration and
+        # isoformat() work, only the live count is fetched
+        async with ReaderSessionLocal() as db:
+            cached = url_cache.get(short_code)
+            if cached is not None:
+                created_at_iso = cached[1]
+                stored_count = (await db.execute(
+                    select(URLMapping.redirect_count).where(URLMapping.short_code == short_code)
+                )).scalar_one_or_none() or 0
+            else:
+                url_mapping = (await db.execute(
+                    select(URLMapping).where(URLMapping.short_code == short_code)
+                )).scalar_one_or_none()
+                if url_mapping:
+                    created_at_iso = url_mapping.created_at.isoformat()  # type: ignore
+                    stored_count = url_mapping.redirect_count  # type: ignore
+                    url_cache[short_code] = (url_mapping.original_url, created_at_iso)  # type: ignore
+                else:
+                    created_at_iso = None
+                    stored_count = None
+
+            if created_at_iso is not None:
                 initial_data = {
                     "short_code": short_code,
-                    "redirect_count": url_mapping.redirect_count,  # type: ignore
-                    "created_at": url_mapping.created_at.isoformat(),  # type: ignore
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "redirect_count": (stored_count or 0) + pending_counts.get(short_code, 0),
+                    "created_at": created_at_iso,
+                    "timestamp": _iso_now()
                 }
-                await websocket.send_text(json.dumps(initial_data))
-        finally:
-            db.close()
-        
-        # Keep connection alive with heartbeat
+                manager.enqueue(websocket, short_code, initial_data)
+
+        # Hold the connection open until the client goes away; heartbeats
+        # come from the manager's shared broadcast task
         while True:
-            await asyncio.sleep(30)  # Send heartbeat every 30 seconds
-            await websocket.send_text(json.dumps({
-                "type": "heartbeat", 
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }))
-    
+            await websocket.receive_text()
+
     except WebSocketDisconnect:
         manager.disconnect(websocket, short_code)
     except Exception as e:
@@ -246,37 +553,61 @@ async def websocket_analytics(websocket: WebSocket, short_code: str):
 @app.get("/{short_code}")
 async def redirect_to_original(short_code: str):
     """Redirect to the original URL and update analytics"""
-    db = SessionLocal()
     try:
-        url_mapping = db.query(URLMapping).filter(URLMapping.short_code == short_code).first()
-        
-        if not url_mapping:
-            raise HTTPException(status_code=404, detail="Short URL not found")
-        
-        # Update redirect count
-        url_mapping.redirect_count += 1  # type: ignore
-        db.commit()
-        
-        # Send real-time analytics update via WebSocket
-        analytics_data = {
-            "short_code": short_code,
-            "redirect_count": url_mapping.redirect_count,  # type: ignore
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-        await manager.send_analytics_update(short_code, analytics_data)
-        
-        logger.info(f"Redirecting {short_code} to {url_mapping.original_url}")
-        
-        return RedirectResponse(url=url_mapping.original_url, status_code=302)  # type: ignore
-    
+        cached = url_cache.get(short_code)
+        if cached is not None:
+            # Cache hit: no session is opened at all on the redirect itself
+            original_url = cached[0]
+        else:
+            # Column-only Core SELECT: no mapped entity is constructed, so
+            # the hottest read path skips identity-map and instrumentation
+            # overhead entirely
+            async with AsyncSessionLocal() as db:
+                row = (await db.execute(
+                    select(URLMapping.original_url, URLMapping.created_at)
+                    .where(URLMapping.short_code == short_code)
+                )).first()
+
+            if row is None:
+                raise HTTPException(status_code=404, detail="Short URL not found")
+
+            original_url = row[0]
+            url_cache[short_code] = (original_url, row[1].isoformat())
+
+        # Coalesce the count update; the background task flushes it
+        async with pending_counts_lock:
+            pending_counts[short_code] += 1
+
+        # Send real-time analytics update via WebSocket (only costs a
+        # count lookup when someone is actually subscribed)
+        if short_code in manager.active_connections:
+            async with ReaderSessionLocal() as db:
+                stored = (await db.execute(
+                    select(URLMapping.redirect_count).where(URLMapping.short_code == short_code)
+                )).scalar_one_or_none() or 0
+            analytics_data = {
+                "short_code": short_code,
+                "redirect_count": stored + pending_counts.get(short_code, 0),
+                "timestamp": _iso_now()
+            }
+            manager.send_analytics_update(short_code, analytics_data)
+
+        logger.info(f"Redirecting {short_code} to {original_url}")
+
+        return RedirectResponse(url=original_url, status_code=302)
+
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error redirecting: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        db.close()
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    if sys.platform != "win32":
+        # uvloop's libuv-based loop is 2-4x faster than the default
+        # selector loop; unavailable on Windows
+        uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -6,16 +6,46 @@ Usage: python websocket_client.py <short_code> [--url <base_url>]
 
 import asyncio
 import websockets
-import json
-import argparse
 import sys
+from types import SimpleNamespace
 from datetime import datetime
 
+try:
+    # orjson parses UTF-8 bytes directly and is several times faster than
+    # the stdlib tokenizer; fall back so the client still runs without it
+    import orjson
+except ImportError:
+    import json as orjson
+
+try:
+    # Importing at module scope lets aiohttp initialize its TLS/DNS state
+    # once at startup; the REST helpers check for None at call time
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Timestamp layout shared by every displayed field
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Upper bound on the memoized created_at strings; a CLI session watches a
+# handful of codes at most
+_CREATED_CACHE_MAX = 16
+
 class AnalyticsClient:
     def __init__(self, base_url: str = "ws://localhost:8000"):
         self.base_url = base_url
+        # Scheme rewriting happens once here instead of on every API call;
+        # only the prefix can match, so cap the replacements at one
+        self.api_base = base_url.replace('ws://', 'http://', 1).replace('wss://', 'https://', 1)
         self.websocket = None
         self.connected = False
+        # Bound-method caches save an attribute lookup per streamed update
+        self._now = datetime.now
+        self._fromiso = datetime.fromisoformat
+        self._write = sys.stdout.write
+        # created_at never changes between updates for a given code, so
+        # memoize raw string -> formatted text (bounded, see _CREATED_CACHE_MAX)
+        self._created_fmt_cache = {}
     
     async def connect(self, short_code: str):
         """Connect to WebSocket and listen for analytics updates"""
@@ -28,9 +58,12 @@ class AnalyticsClient:
             print(f"✅ Connected to real-time analytics for short code: {short_code}")
             print("Listening for updates... (Press Ctrl+C to disconnect)\n")
             
-            async for message in self.websocket:
+            # Manual recv loop: binary frames arrive as bytes and go to the
+            # parser untouched; only text frames pay a str round-trip
+            while True:
+                message = await self.websocket.recv()
                 await self.handle_message(message)
-                
+
         except websockets.exceptions.ConnectionClosed:
             print("🔌 Connection closed")
             self.connected = False
@@ -41,42 +74,67 @@ class AnalyticsClient:
             print(f"❌ Error: {e}")
             self.connected = False
     
-    async def handle_message(self, message: str):
-        """Handle incoming WebSocket messages"""
+    async def handle_message(self, message):
+        """Handle an incoming WebSocket frame (str or bytes)"""
         try:
-            data = json.loads(message)
-            
+            raw = message if isinstance(message, (bytes, bytearray)) else message.encode()
+
+            # Heartbeats are the most frequent frame and the server always
+            # serializes them with the type field first, so a prefix check
+            # skips the JSON parser for the common case
+            if raw.startswith(b'{"type":"heartbeat"'):
+                print("💓 Heartbeat received")
+                return
+
+            # orjson prefers bytes; passing raw avoids its internal re-encode
+            data = orjson.loads(raw)
+
             if data.get("type") == "heartbeat":
                 print("💓 Heartbeat received")
                 return
-            
+
             # Display analytics data
             self.display_analytics(data)
-            
-        except json.JSONDecodeError:
+
+        except ValueError:
             print(f"⚠️  Invalid JSON received: {message}")
     
     def display_analytics(self, data: dict):
         """Display analytics data in a formatted way"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        print("=" * 50)
-        print(f"📊 Analytics Update - {timestamp}")
-        print("=" * 50)
-        print(f"Short Code: {data.get('short_code', 'N/A')}")
-        print(f"Redirect Count: {data.get('redirect_count', 0)}")
-        
+        timestamp = self._now().strftime(_TS_FMT)
+
+        # Build the whole block and emit it with one write; per-line print
+        # calls become syscall-bound when updates stream in quickly
+        sep = "=" * 50
+        lines = [
+            sep,
+            f"📊 Analytics Update - {timestamp}",
+            sep,
+            f"Short Code: {data.get('short_code', 'N/A')}",
+            f"Redirect Count: {data.get('redirect_count', 0)}",
+        ]
+
         if 'created_at' in data:
-            created_at = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
-            print(f"Created: {created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        
+            raw = data['created_at']
+            fmt = self._created_fmt_cache.get(raw)
+            if fmt is None:
+                # Python 3.11's fromisoformat parses trailing "Z" natively
+                fmt = self._fromiso(raw).strftime(_TS_FMT)
+                if len(self._created_fmt_cache) >= _CREATED_CACHE_MAX:
+                    # evict the oldest insertion to keep the cache bounded
+                    self._created_fmt_cache.pop(next(iter(self._created_fmt_cache)))
+                self._created_fmt_cache[raw] = fmt
+            lines.append(f"Created: {fmt}")
+
         if 'timestamp' in data:
-            update_time = datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
-            print(f"Last Update: {update_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        print("-" * 50)
-        print()
-    
+            update_time = self._fromiso(data['timestamp'])
+            lines.append(f"Last Update: {update_time.strftime(_TS_FMT)}")
+
+        lines.append("-" * 50)
+        lines.append("\n")
+        self._write("\n".join(lines))
+        sys.stdout.flush()
+
     async def disconnect(self):
         """Disconnect from WebSocket"""
         if self.websocket and self.connected:
@@ -84,20 +142,18 @@ class AnalyticsClient:
             self.connected = False
             print("👋 Disconnected successfully")
 
-async def create_short_url(base_url: str, long_url: str):
-    """Create a short URL using the API"""
-    import aiohttp
-    
-    api_url = base_url.replace('ws://', 'http://').replace('wss://', 'https://')
-    
-    async with aiohttp.ClientSession() as session:
+    async def create_short_url(self, long_url: str):
+        """Create a short URL using the API"""
+        session = await _get_session()
         try:
+            # Pre-serialized bytes via data= skip aiohttp's json machinery
             async with session.post(
-                f"{api_url}/shorten",
-                json={"url": long_url}
+                f"{self.api_base}/shorten",
+                data=orjson.dumps({"url": long_url}),
+                headers={"Content-Type": "application/json"},
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     return data
                 else:
                     print(f"❌ Error creating short URL: HTTP {response.status}")
@@ -106,17 +162,13 @@ async def create_short_url(base_url: str, long_url: str):
             print(f"❌ Error creating short URL: {e}")
             return None
 
-async def get_analytics(base_url: str, short_code: str):
-    """Get current analytics for a short code"""
-    import aiohttp
-    
-    api_url = base_url.replace('ws://', 'http://').replace('wss://', 'https://')
-    
-    async with aiohttp.ClientSession() as session:
+    async def get_analytics(self, short_code: str):
+        """Get current analytics for a short code"""
+        session = await _get_session()
         try:
-            async with session.get(f"{api_url}/analytics/{short_code}") as response:
+            async with session.get(f"{self.api_base}/analytics/{short_code}") as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     return data
                 else:
                     print(f"❌ Error fetching analytics: HTTP {response.status}")
@@ -125,47 +177,100 @@ async def get_analytics(base_url: str, short_code: str):
             print(f"❌ Error fetching analytics: {e}")
             return None
 
+def _json_dumps(obj) -> str:
+    """Serialize for aiohttp, which wants str (orjson returns bytes)"""
+    payload = orjson.dumps(obj)
+    return payload.decode() if isinstance(payload, bytes) else payload
+
+# One keep-alive session shared by all API calls; opening a session per
+# request would redo the TCP/TLS handshake every time
+_SESSION = None
+
+async def _get_session():
+    """Lazily create the shared aiohttp session on the running loop"""
+    global _SESSION
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for --create/--current; pip install aiohttp")
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30),
+            json_serialize=_json_dumps,
+        )
+    return _SESSION
+
+async def _close_session():
+    """Close the shared session, if one was created"""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+
 def main():
-    parser = argparse.ArgumentParser(description="WebSocket CLI Client for URL Shortener Analytics")
-    parser.add_argument("short_code", help="Short code to monitor")
-    parser.add_argument("--url", default="ws://localhost:8000", help="Base WebSocket URL")
-    parser.add_argument("--create", help="Create a short URL first from this long URL")
-    parser.add_argument("--current", action="store_true", help="Show current analytics before connecting to WebSocket")
-    
-    args = parser.parse_args()
-    
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        # Fast path for the common `python websocket_client.py CODE`
+        # invocation: skip importing and building the argparse machinery
+        args = SimpleNamespace(
+            short_code=sys.argv[1],
+            url="ws://localhost:8000",
+            create=None,
+            current=False,
+        )
+    else:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="WebSocket CLI Client for URL Shortener Analytics")
+        parser.add_argument("short_code", help="Short code to monitor")
+        parser.add_argument("--url", default="ws://localhost:8000", help="Base WebSocket URL")
+        parser.add_argument("--create", help="Create a short URL first from this long URL")
+        parser.add_argument("--current", action="store_true", help="Show current analytics before connecting to WebSocket")
+
+        args = parser.parse_args()
+
+    # uvloop's event loop is noticeably faster for socket-heavy workloads;
+    # it is optional and unavailable on Windows
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     async def run():
         client = AnalyticsClient(args.url)
-        
-        # Create short URL if requested
-        if args.create:
-            print(f"Creating short URL for: {args.create}")
-            result = await create_short_url(args.url, args.create)
-            if result:
-                print(f"✅ Created short URL:")
-                print(f"   Short Code: {result['short_code']}")
-                print(f"   Shortened URL: {result['shortened_url']}")
-                print(f"   Original URL: {result['original_url']}")
-                print()
-                
-                # Update short_code to the newly created one
-                args.short_code = result['short_code']
-            else:
-                return
-        
-        # Show current analytics if requested
-        if args.current:
-            print(f"Fetching current analytics for: {args.short_code}")
-            analytics = await get_analytics(args.url, args.short_code)
-            if analytics:
-                client.display_analytics(analytics)
-            else:
-                print("❌ Could not fetch current analytics")
-                return
-        
-        # Connect to WebSocket for real-time updates
-        await client.connect(args.short_code)
-    
+
+        try:
+            # Create short URL if requested
+            if args.create:
+                print(f"Creating short URL for: {args.create}")
+                result = await client.create_short_url(args.create)
+                if result:
+                    print(f"✅ Created short URL:")
+                    print(f"   Short Code: {result['short_code']}")
+                    print(f"   Shortened URL: {result['shortened_url']}")
+                    print(f"   Original URL: {result['original_url']}")
+                    print()
+
+                    # Update short_code to the newly created one
+                    args.short_code = result['short_code']
+                else:
+                    return
+
+            # Show current analytics if requested
+            if args.current:
+                print(f"Fetching current analytics for: {args.short_code}")
+                analytics = await client.get_analytics(args.short_code)
+                if analytics:
+                    client.display_analytics(analytics)
+                else:
+                    print("❌ Could not fetch current analytics")
+                    return
+
+            # Connect to WebSocket for real-time updates
+            await client.connect(args.short_code)
+        finally:
+            await _close_session()
+
     try:
         asyncio.run(run())
     except KeyboardInterrupt:
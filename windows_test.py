@@ -6,54 +6,82 @@ Run with: python windows_test.py
 
 import sys
 import os
-import time
-import gc
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import httpx
+import orjson
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from main import app, get_db, Base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# "main" is shadowed by this file's main() entry point, so keep an
+# explicit module alias for swapping the session factories
+import main as main_module
+from main import app, Base
+
+# Decode response bodies with orjson; TestClient rides on httpx, so every
+# response.json() in the tests picks this up transparently
+httpx.Response.json = lambda self, **kwargs: orjson.loads(self.content)
 
 # Use in-memory SQLite database to avoid Windows file issues
-TEST_DATABASE_URL = "sqlite:///:memory:"
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# The endpoints open sessions via main's module-level factories, so the
+# harness swaps those rather than using dependency overrides. The swap
+# happens once before the thread pool starts and is restored once after
+# it drains — no test mutates shared routing state, which is what makes
+# the parallel run race-free without per-test ContextVar plumbing.
+_ORIG_SESSION_FACTORY = main_module.AsyncSessionLocal
+_ORIG_READER_FACTORY = main_module.ReaderSessionLocal
 
 def setup_test_db():
     """Set up an in-memory test database"""
-    engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
+    # StaticPool keeps a single connection so every session sees the same
+    # in-memory database
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+    tables_created = False
+    ddl_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def test_session():
+        # Create tables lazily so DDL runs on the test client's event loop;
+        # the lock keeps concurrent first requests from racing the DDL
+        nonlocal tables_created
+        if not tables_created:
+            async with ddl_lock:
+                if not tables_created:
+                    async with engine.begin() as conn:
+                        await conn.run_sync(Base.metadata.create_all)
+                    tables_created = True
+        async with TestingSessionLocal() as db:
             yield db
-        finally:
-            db.close()
-    
-    app.dependency_overrides[get_db] = override_get_db
-    Base.metadata.create_all(bind=engine)
-    
+
+    main_module.AsyncSessionLocal = test_session
+    main_module.ReaderSessionLocal = test_session
+
     return engine
 
-def cleanup_test_db():
-    """Clean up test database"""
-    app.dependency_overrides.clear()
-    # Force garbage collection
-    gc.collect()
+def cleanup_test_db(engine):
+    """Restore the real session factories and release the test engine"""
+    main_module.AsyncSessionLocal = _ORIG_SESSION_FACTORY
+    main_module.ReaderSessionLocal = _ORIG_READER_FACTORY
+    # Dispose just the engine's connections instead of forcing a full
+    # garbage-collection pass over the whole heap
+    asyncio.run(engine.dispose())
 
-def run_test(test_name, test_func):
-    """Run a single test with setup and cleanup"""
-    print(f"🧪 {test_name}... ", end="", flush=True)
+def run_test(test_name, test_func, client):
+    """Run a single test against the shared client, returning (ok, error)"""
     try:
-        engine = setup_test_db()
-        with TestClient(app) as client:
-            test_func(client)
-        cleanup_test_db()
-        print("✅ PASSED")
-        return True
+        test_func(client)
+        return True, None
     except Exception as e:
-        print(f"❌ FAILED")
-        print(f"   Error: {str(e)}")
-        cleanup_test_db()
-        return False
+        return False, str(e)
 
 def test_health_check(client):
     """Test health check endpoint"""
@@ -172,11 +200,31 @@ def main():
     
     passed = 0
     total = len(tests)
-    
-    for test_name, test_func in tests:
-        if run_test(test_name, test_func):
+
+    # One engine and one TestClient for the whole suite: per-test DDL and
+    # app startup dominated the runtime, and the tests touch disjoint URLs
+    # so they cannot observe each other's rows
+    engine = setup_test_db()
+    try:
+        with TestClient(app) as client:
+            # The tests are independent and I/O-bound through the client,
+            # so a small thread pool overlaps them; results come back in
+            # submission order and are reported after the pool drains
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(
+                    lambda t: run_test(t[0], t[1], client), tests
+                ))
+    finally:
+        cleanup_test_db(engine)
+
+    for (test_name, _), (ok, error) in zip(tests, results):
+        # One print per test: no partial-line writes or forced flushes
+        if ok:
+            status = "✅ PASSED"
             passed += 1
-        time.sleep(0.1)  # Small delay between tests
+        else:
+            status = f"❌ FAILED\n   Error: {error}"
+        print(f"🧪 {test_name}... {status}")
     
     print("=" * 50)
     print(f"📊 Results: {passed}/{total} tests passed")